@@ -1,70 +1,418 @@
 from __future__ import annotations
+import os
 import random
-import statistics
-import time
-from typing import Callable, List, Tuple
+import timeit
+from bisect import bisect_left, bisect_right
+from multiprocessing import Pool
+from typing import Callable, List, Literal, Optional, Tuple
 
 from heapsort import heapsort
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; gen_data and the NumPy reference sorts need it
+    np = None  # type: ignore[assignment]
+
+try:
+    from numba import njit
+    HAVE_NUMBA = np is not None
+except ImportError:  # Numba is optional; the compiled kernels fall back to the pure-Python sorts
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):  # type: ignore[no-redef]
+        """
+        No-op stand-in for numba.njit so the kernels below still define.
+        """
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+
+MIN_RUN = 32  # merge sorts insertion-sort blocks/runs of this size before merging
+INSERTION_CUTOFF = 16  # quicksort hands ranges smaller than this to insertion sort
+
+
+@njit(cache=True)
+def _insertion_nb(a, lo, hi):
+    """
+    Compiled insertion sort of a[lo..hi] (inclusive), shifting larger elements right.
+    """
+    for i in range(lo + 1, hi + 1):
+        x = a[i]
+        j = i - 1
+        while j >= lo and a[j] > x:
+            a[j + 1] = a[j]
+            j -= 1
+        a[j + 1] = x
+
+
+@njit(cache=True)
+def _merge(src, dst, istart, imid, iend):
+    """
+    Merge sorted runs src[istart:imid] and src[imid:iend] into dst[istart:iend].
+    """
+    i, j, k = istart, imid, istart
+    while i < imid and j < iend:
+        if src[i] <= src[j]:
+            dst[k] = src[i]
+            i += 1
+        else:
+            dst[k] = src[j]
+            j += 1
+        k += 1
+
+    # One side is exhausted: bulk-copy the other side's tail
+    if i < imid:
+        dst[k:iend] = src[i:imid]
+    elif j < iend:
+        dst[k:iend] = src[j:iend]
+
+
+@njit(cache=True)
+def _merge_sort_nb(src, dst):
+    """
+    Compiled bottom-up merge sort over int64 arrays.
+    Returns whichever buffer holds the sorted result.
+    """
+    n = src.shape[0]
+    # Insertion-sort MIN_RUN-sized blocks, then merge from that width up
+    for lo in range(0, n, MIN_RUN):
+        _insertion_nb(src, lo, min(lo + MIN_RUN, n) - 1)
+
+    width = MIN_RUN
+    while width < n:
+        i = 0
+        while i < n:
+            istart = i
+            imid = min(i + width, n)
+            iend = min(i + 2 * width, n)
+            _merge(src, dst, istart, imid, iend)
+            i += 2 * width
+        src, dst = dst, src
+        width *= 2
+    return src
+
+
+def _int64_copy(a: List[int]):
+    """
+    Return a fresh int64 ndarray copy of a for the compiled kernels, or None
+    when a holds anything else (floats, ints beyond 64 bits, mixed objects).
+    Callers fall back to the pure-Python sort on None, so the compiled path
+    never changes the values it returns.
+    """
+    try:
+        arr = np.array(a)  # always a copy, so kernels may sort it in place
+    except OverflowError:
+        return None
+    if arr.ndim != 1 or arr.dtype.kind != "i":
+        return None
+    return arr.astype(np.int64, copy=False)
+
 
 def mergesort(a: List[int]) -> List[int]:
     """
     Iterative (bottom-up) merge sort to avoid recursion depth issues.
     Returns a new sorted list.
+
+    Uses the Numba-compiled kernel when NumPy/Numba are installed and the
+    input is int64-representable, otherwise the pure-Python version below.
     """
-    n = len(a)
+    if HAVE_NUMBA and len(a) > 1:
+        src = _int64_copy(a)
+        if src is not None:
+            return _merge_sort_nb(src, np.empty_like(src)).tolist()
+    return _mergesort_py(a)
+
+
+MIN_GALLOP = 7  # consecutive wins from one side before switching to galloping
+
+
+def _insertion_sort(a: List[int], lo: int, hi: int) -> None:
+    """
+    Stable insertion sort of a[lo..hi] (inclusive).
+    Binary search finds each slot and a slice assignment does the shift in C.
+    """
+    for i in range(lo + 1, hi + 1):
+        x = a[i]
+        pos = bisect_right(a, x, lo, i)
+        if pos < i:
+            a[pos + 1:i + 1] = a[pos:i]
+            a[pos] = x
+
+
+def _count_run(a: List[int], lo: int, hi: int) -> int:
+    """
+    Return the length of the natural run starting at a[lo] (hi exclusive).
+    Strictly descending runs are reversed in place so every run ascends.
+    """
+    run_hi = lo + 1
+    if run_hi == hi:
+        return 1
+
+    if a[run_hi] < a[lo]:
+        run_hi += 1
+        while run_hi < hi and a[run_hi] < a[run_hi - 1]:
+            run_hi += 1
+        a[lo:run_hi] = a[lo:run_hi][::-1]
+    else:
+        run_hi += 1
+        while run_hi < hi and a[run_hi] >= a[run_hi - 1]:
+            run_hi += 1
+    return run_hi - lo
+
+
+def _merge_runs(a: List[int], lo: int, mid: int, hi: int) -> None:
+    """
+    Stable in-place merge of adjacent sorted runs a[lo:mid] and a[mid:hi].
+    After MIN_GALLOP consecutive wins from one side, binary-search how far
+    that side can go and move the whole chunk with one slice assignment.
+    """
+    # Elements already in their final place need not be touched
+    lo = bisect_right(a, a[mid], lo, mid)
+    if lo == mid:
+        return
+    hi = bisect_left(a, a[mid - 1], mid, hi)
+
+    left = a[lo:mid]
+    n_left = mid - lo
+    i, j, k = 0, mid, lo
+    left_wins = right_wins = 0
+    while i < n_left and j < hi:
+        if a[j] < left[i]:
+            a[k] = a[j]
+            j += 1
+            k += 1
+            right_wins += 1
+            left_wins = 0
+            if right_wins >= MIN_GALLOP:
+                end = bisect_left(a, left[i], j, hi)
+                a[k:k + (end - j)] = a[j:end]
+                k += end - j
+                j = end
+                right_wins = 0
+        else:
+            a[k] = left[i]
+            i += 1
+            k += 1
+            left_wins += 1
+            right_wins = 0
+            if left_wins >= MIN_GALLOP:
+                end = bisect_right(left, a[j], i, n_left)
+                a[k:k + (end - i)] = left[i:end]
+                k += end - i
+                i = end
+                left_wins = 0
+
+    # Leftover right-run elements are already in place
+    if i < n_left:
+        a[k:k + (n_left - i)] = left[i:]
+
+
+def _merge_at(a: List[int], runs: List[Tuple[int, int]], idx: int) -> None:
+    """
+    Merge pending runs idx and idx+1 (each a (start, length) pair).
+    """
+    start, len1 = runs[idx]
+    _, len2 = runs[idx + 1]
+    _merge_runs(a, start, start + len1, start + len1 + len2)
+    runs[idx] = (start, len1 + len2)
+    del runs[idx + 1]
+
+
+def _merge_collapse(a: List[int], runs: List[Tuple[int, int]]) -> None:
+    """
+    Merge pending runs until Timsort's stack invariants hold:
+    len[i-2] > len[i-1] + len[i] and len[i-1] > len[i].
+    """
+    while len(runs) > 1:
+        n = len(runs) - 2
+        if (n > 0 and runs[n - 1][1] <= runs[n][1] + runs[n + 1][1]) or \
+                (n > 1 and runs[n - 2][1] <= runs[n - 1][1] + runs[n][1]):
+            if runs[n - 1][1] < runs[n + 1][1]:
+                n -= 1
+        elif runs[n][1] > runs[n + 1][1]:
+            return
+        _merge_at(a, runs, n)
+
+
+def _mergesort_py(a: List[int]) -> List[int]:
+    """
+    Natural merge sort (a mini-Timsort): detect ascending/descending runs
+    in one pass, keep them on a balanced pending-run stack, and merge with
+    galloping. Runs shorter than MIN_RUN are extended with insertion sort.
+    Already sorted or reversed input costs O(n).
+    """
+    # A list, not array('q'): array reads box a fresh int on every access,
+    # which measured ~2x slower here. Packed int64 storage is what the
+    # Numba path uses instead.
+    arr = list(a)
+    n = len(arr)
     if n <= 1:
-        return list(a)
+        return arr
 
-    src = list(a)
-    dst = [0] * n
+    runs: List[Tuple[int, int]] = []
+    lo = 0
+    while lo < n:
+        length = _count_run(arr, lo, n)
+        if length < MIN_RUN:
+            length = min(MIN_RUN, n - lo)
+            _insertion_sort(arr, lo, lo + length - 1)
+        runs.append((lo, length))
+        _merge_collapse(arr, runs)
+        lo += length
 
-    width = 1
-    while width < n:
-        for left in range(0, n, 2 * width):
-            mid = min(left + width, n)
-            right = min(left + 2 * width, n)
-
-            i, j, k = left, mid, left
-            while i < mid and j < right:
-                if src[i] <= src[j]:
-                    dst[k] = src[i]
-                    i += 1
-                else:
-                    dst[k] = src[j]
-                    j += 1
-                k += 1
-
-            while i < mid:
-                dst[k] = src[i]
-                i += 1
-                k += 1
+    # Force-collapse whatever is still pending
+    while len(runs) > 1:
+        idx = len(runs) - 2
+        if idx > 0 and runs[idx - 1][1] < runs[idx + 1][1]:
+            idx -= 1
+        _merge_at(arr, runs, idx)
 
-            while j < right:
-                dst[k] = src[j]
-                j += 1
-                k += 1
+    return arr
 
-        src, dst = dst, src
-        width *= 2
 
-    return src
+# Below this, pool startup (~8 ms) plus the pickling round trip (~90 ns/item)
+# costs more than splitting the sort can save; run() times it from here up.
+PARALLEL_MIN_N = 50_000
+
+
+def _merge_two(a: List[int], b: List[int]) -> List[int]:
+    """
+    Merge two sorted lists. Timsort sees exactly two runs in a + b,
+    so this is a single galloping merge done in C.
+    """
+    return sorted(a + b)
+
+
+def parallel_mergesort(a: List[int], processes: Optional[int] = None) -> List[int]:
+    """
+    Multi-process merge sort for large inputs.
+    Splits the input into one slice per worker, sorts the slices in a
+    process pool, then merges neighbouring pairs level by level until two
+    lists remain. The top merge is serial either way, so it runs here in the
+    parent rather than shipping all n items to a worker and back.
+    Inputs shorter than PARALLEL_MIN_N use the sequential mergesort.
+    """
+    n = len(a)
+    procs = processes or os.cpu_count() or 1
+    if n < PARALLEL_MIN_N or procs < 2:
+        return mergesort(a)
+
+    step = -(-n // procs)  # ceil(n / procs)
+    chunks = [list(a[i:i + step]) for i in range(0, n, step)]
+
+    with Pool(procs) as pool:
+        parts = pool.map(sorted, chunks)
+        while len(parts) > 2:
+            merged = pool.starmap(_merge_two, zip(parts[0::2], parts[1::2]))
+            if len(parts) % 2:
+                merged.append(parts[-1])  # odd one out waits for the next level
+            parts = merged
+
+    return _merge_two(*parts) if len(parts) == 2 else parts[0]
+
+
+@njit(cache=True)
+def _qs3_nb(a, lo_init, hi_init):
+    """
+    Compiled randomized 3-way Quicksort over an int64 array.
+    Uses an explicit (lo, hi) stack instead of recursion; the smaller
+    side is always popped next, so the stack stays O(log n) deep.
+    """
+    stk = np.empty(2 * 64, np.int64)
+    stk[0] = lo_init
+    stk[1] = hi_init
+    top = 2
+    while top > 0:
+        top -= 2
+        lo = stk[top]
+        hi = stk[top + 1]
+        if hi - lo < INSERTION_CUTOFF:
+            _insertion_nb(a, lo, hi)
+            continue
+
+        pivot = a[lo + np.random.randint(0, hi - lo + 1)]
+
+        # 3-way partition: < pivot | == pivot | > pivot
+        lt, i, gt = lo, lo, hi
+        while i <= gt:
+            v = a[i]
+            if v < pivot:
+                a[i] = a[lt]
+                a[lt] = v
+                lt += 1
+                i += 1
+            elif v > pivot:
+                a[i] = a[gt]
+                a[gt] = v
+                gt -= 1
+            else:
+                i += 1
+
+        # Push the larger side first so the smaller one is processed next
+        if lt - lo < hi - gt:
+            stk[top] = gt + 1
+            stk[top + 1] = hi
+            stk[top + 2] = lo
+            stk[top + 3] = lt - 1
+        else:
+            stk[top] = lo
+            stk[top + 1] = lt - 1
+            stk[top + 2] = gt + 1
+            stk[top + 3] = hi
+        top += 4
 
 
 def quicksort(a: List[int]) -> List[int]:
     """
-    Randomized 3-way Quicksort (handles duplicates well).
+    3-way Quicksort (handles duplicates well).
+
+    Uses the Numba-compiled kernel (random pivots) when NumPy/Numba are
+    installed and the input is int64-representable; the pure-Python path
+    uses median-of-three / ninther pivots.
     """
-    arr = list(a)
+    if HAVE_NUMBA and len(a) > 1:
+        arr = _int64_copy(a)
+        if arr is not None:
+            _qs3_nb(arr, 0, len(arr) - 1)
+            return arr.tolist()
+
+    arr = list(a)  # list beats array('q') here too; see _mergesort_py
     _quicksort_3way(arr, 0, len(arr) - 1)
     return arr
 
 
+def _median3(x: int, y: int, z: int) -> int:
+    """
+    Return the middle value of x, y, z.
+    """
+    if x < y:
+        if y < z:
+            return y
+        return z if x < z else x
+    if x < z:
+        return x
+    return z if y < z else y
+
+
 def _quicksort_3way(a: List[int], lo: int, hi: int) -> None:
     while lo < hi:
-        # random pivot
-        pivot_index = random.randint(lo, hi)
-        pivot = a[pivot_index]
+        if hi - lo < INSERTION_CUTOFF:
+            _insertion_sort(a, lo, hi)
+            return
+
+        # Deterministic pivot: median of three, or a ninther
+        # (median of three medians) on larger ranges. No RNG calls.
+        mid = (lo + hi) // 2
+        if hi - lo > 40:
+            eps = (hi - lo) // 8
+            pivot = _median3(
+                _median3(a[lo], a[lo + eps], a[lo + 2 * eps]),
+                _median3(a[mid - eps], a[mid], a[mid + eps]),
+                _median3(a[hi - 2 * eps], a[hi - eps], a[hi]),
+            )
+        else:
+            pivot = _median3(a[lo], a[mid], a[hi])
 
         # 3-way partition: < pivot | == pivot | > pivot
         lt, i, gt = lo, lo, hi
@@ -92,46 +440,89 @@ def _quicksort_3way(a: List[int], lo: int, hi: int) -> None:
 
 
 def gen_data(n: int, kind: str) -> List[int]:
+    """
+    Generate benchmark input in one vectorized call per kind
+    (NumPy when available, otherwise random.choices) rather than n randint calls.
+    """
     if kind == "random":
-        return [random.randint(0, n) for _ in range(n)]
+        if np is not None:
+            return np.random.randint(0, n + 1, n, dtype=np.int64).tolist()
+        return random.choices(range(n + 1), k=n)
     if kind == "sorted":
         return list(range(n))
     if kind == "reverse":
         return list(range(n, 0, -1))
     if kind == "few_unique":
         # Many duplicates (interesting for some algorithms)
-        return [random.randint(0, 10) for _ in range(n)]
+        if np is not None:
+            return np.random.randint(0, 11, n, dtype=np.int64).tolist()
+        return random.choices(range(11), k=n)
     raise ValueError(f"Unknown kind: {kind}")
 
 
-def time_func(fn: Callable[[List[int]], List[int]], data: List[int], trials: int = 7) -> float:
+def time_func(fn: Callable[[List[int]], List[int]], data: List[int]) -> float:
     """
-    Returns median runtime in milliseconds over 'trials'.
+    Returns mean runtime per call in milliseconds.
+    timeit's autorange picks a loop count that runs for at least 0.2s,
+    which keeps sub-millisecond sorts above timer resolution; timeit also
+    disables GC while timing.
     """
-    times = []
-    for _ in range(trials):
-        arr = list(data)
-        t0 = time.perf_counter()
-        out = fn(arr)
-        t1 = time.perf_counter()
-        # correctness check (cheap sanity)
-        if out != sorted(arr):
-            raise AssertionError(f"{fn.__name__} produced incorrect output.")
-        times.append((t1 - t0) * 1000)
-    return statistics.median(times)
+    # One-shot correctness check (cheap sanity); also warms up any JIT kernel
+    if fn(list(data)) != sorted(data):
+        raise AssertionError(f"{fn.__name__} produced incorrect output.")
+
+    # fn may mutate its input, so refill one reusable scratch buffer per call
+    # (slice assignment reuses its capacity) instead of allocating a new copy
+    scratch = list(data)
+
+    def call() -> None:
+        scratch[:] = data
+        fn(scratch)
+
+    n_iter, total = timeit.Timer(call).autorange()
+    return total / n_iter * 1000
+
+
+NumpySortKind = Literal["quicksort", "mergesort", "heapsort"]
+NUMPY_SORT_KINDS: Tuple[NumpySortKind, ...] = ("quicksort", "mergesort", "heapsort")
+
+
+def numpy_sort(kind: NumpySortKind) -> Callable[[List[int]], List[int]]:
+    """
+    List-in/list-out wrapper around np.sort(kind=...), so NumPy's C sorts
+    run through the same harness as the Python ones (list round-trips included).
+    """
+    def fn(a: List[int]) -> List[int]:
+        return np.sort(np.asarray(a), kind=kind).tolist()
+
+    fn.__name__ = f"numpy_sort_{kind}"
+    return fn
+
+
+def time_np_sort(data_np, kind: NumpySortKind) -> float:
+    """
+    Returns mean runtime per np.sort call in milliseconds on a prebuilt
+    ndarray, i.e. the sort alone without list conversions.
+    """
+    n_iter, total = timeit.Timer(lambda: np.sort(data_np, kind=kind)).autorange()
+    return total / n_iter * 1000
 
 
 def run() -> None:
     algos: List[Tuple[str, Callable[[List[int]], List[int]]]] = [
         ("Heapsort", heapsort),
-        ("Quicksort (rand)", quicksort),
+        ("Quicksort (3-way)", quicksort),
         ("Merge Sort", mergesort),
+        ("Timsort (builtin)", sorted),
     ]
+    if np is not None:
+        algos += [(f"NumPy {k}", numpy_sort(k)) for k in NUMPY_SORT_KINDS]
 
-    sizes = [1_000, 5_000, 10_000, 20_000]
+    sizes = [1_000, 5_000, 10_000, 20_000, 100_000]
     kinds = ["random", "sorted", "reverse", "few_unique"]
 
-    print("Median time (ms) over 7 trials\n")
+    procs = os.cpu_count() or 1
+    print("Mean time (ms) per call, timeit autorange\n")
 
     for kind in kinds:
         print(f"=== Data distribution: {kind} ===")
@@ -139,9 +530,21 @@ def run() -> None:
             data = gen_data(n, kind)
             row = [f"n={n:>6}"]
             for name, fn in algos:
-                ms = time_func(fn, data, trials=7)
+                ms = time_func(fn, data)
                 row.append(f"{name}: {ms:8.2f}")
+            # parallel_mergesort falls back to the sequential sort below 2 CPUs,
+            # so the column would only duplicate Merge Sort there.
+            if n >= PARALLEL_MIN_N and procs >= 2:
+                ms = time_func(parallel_mergesort, data)
+                row.append(f"Parallel Merge Sort ({procs} procs): {ms:8.2f}")
             print(" | ".join(row))
+
+            if np is not None:
+                data_np = np.asarray(data, dtype=np.int64)
+                row = [f"{'ndarray':>8}"]
+                for k in NUMPY_SORT_KINDS:
+                    row.append(f"NumPy {k}: {time_np_sort(data_np, k):8.2f}")
+                print(" | ".join(row))
         print()
 
 
@@ -1,16 +1,23 @@
 from __future__ import annotations
+import heapq
 from typing import List
 
+# C-implemented max-heap helpers from the _heapq extension. They are public
+# from Python 3.14 and private before that; None means use the Python path.
+_heapify_max = getattr(heapq, "heapify_max", None) or getattr(heapq, "_heapify_max", None)
+_heappop_max = getattr(heapq, "heappop_max", None) or getattr(heapq, "_heappop_max", None)
+
 
 def _sift_down(a: List[int], start: int, end: int) -> None:
     """
     Restore max-heap property in a[start:end+1], assuming children are already heaps.
     """
     root = start
+    root_val = a[root]  # held aside; larger children move up into the hole
     while True:
         left = 2 * root + 1
         if left > end:
-            return
+            break
 
         right = left + 1
         # Pick the larger child
@@ -18,11 +25,14 @@ def _sift_down(a: List[int], start: int, end: int) -> None:
         if right <= end and a[right] > a[left]:
             child = right
 
-        if a[child] > a[root]:
-            a[root], a[child] = a[child], a[root]
+        child_val = a[child]
+        if child_val > root_val:
+            a[root] = child_val
             root = child
         else:
-            return
+            break
+
+    a[root] = root_val
 
 
 def _build_max_heap(a: List[int]) -> None:
@@ -44,6 +54,13 @@ def heapsort(a: List[int]) -> List[int]:
     if n <= 1:
         return arr
 
+    if _heapify_max is not None and _heappop_max is not None:
+        # Same max-heap algorithm, with build and extraction done in C
+        _heapify_max(arr)
+        out = [_heappop_max(arr) for _ in range(n)]
+        out.reverse()
+        return out
+
     _build_max_heap(arr)
 
     # Repeatedly move max to end and re-heap